@@ -0,0 +1,41 @@
+"""
+Django settings used when running the test suite.
+
+Extends the regular project settings with overrides that only make sense
+for tests, e.g. a fast password hasher instead of PBKDF2.
+"""
+from app.settings import *  # noqa: F401,F403
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/3.1/topics/testing/overview/#password-hashing
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Database
+# https://docs.djangoproject.com/en/3.1/ref/settings/#databases
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+# Migrations
+# The test database is built straight from the models, like pytest-django's
+# --nomigrations, so `manage.py test` skips the migration graph as well.
+
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
@@ -2,25 +2,31 @@ from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
+USER_CHANGELIST_URL = reverse('admin:core_user_changelist')
+USER_ADD_URL = reverse('admin:core_user_add')
+
+User = get_user_model()
+
 
 class AdminSiteTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(
             email='admin@example.com',
             password='password123'
         )
-        self.client.force_login(self.admin_user)
-
-        self.regular_user = get_user_model().objects.create_user(
+        cls.regular_user = User.objects.create_user(
             email='user@example.com',
             password='password321',
             name='Test user full name'
         )
 
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_user_listed(self):
-        url = reverse('admin:core_user_changelist')
-        response = self.client.get(url)
+        response = self.client.get(USER_CHANGELIST_URL)
 
         self.assertContains(response, self.regular_user.name)
         self.assertContains(response, self.regular_user.email)
@@ -32,7 +38,6 @@ class AdminSiteTests(TestCase):
         self.assertEqual(result.status_code, 200)
 
     def test_create_user_page(self):
-        url = reverse('admin:core_user_add')
-        result = self.client.get(url)
+        result = self.client.get(USER_ADD_URL)
 
         self.assertEqual(result.status_code, 200)
@@ -3,16 +3,18 @@ from django.contrib.auth import get_user_model
 from core import models
 from unittest.mock import patch
 
+User = get_user_model()
 
-def sample_user(email='example@example.com', password='password'):
-    return get_user_model().objects.create_user(email, password)
+
+def sample_user(email='example@example.com'):
+    return User.objects.create_user(email)
 
 
 class ModelTests(TestCase):
     def test_create_user_with_email_successful(self):
         email = 'example@example.com'
         password = 'password'
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=email,
             password=password
         )
@@ -22,7 +24,7 @@ class ModelTests(TestCase):
 
     def test_new_user_email_normalized(self):
         email = 'example@EXAMPLE.com'
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=email,
             password='password'
         )
@@ -31,13 +33,13 @@ class ModelTests(TestCase):
 
     def test_new_user_invalid_email(self):
         with self.assertRaises(ValueError):
-            get_user_model().objects.create_user(
+            User.objects.create_user(
                 email=None,
                 password='password'
             )
 
     def test_create_new_superuser(self):
-        user = get_user_model().objects.create_superuser(
+        user = User.objects.create_superuser(
             'test@example.com',
             'password123'
         )
@@ -6,14 +6,14 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import Ingredient, Recipe
-from recipe.serializers import IngredientSerializer
 
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
+User = get_user_model()
+
 
 class PublicIngredientsApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_ingredients_unavailable_to_unauthenticated_users(self):
         response = self.client.get(INGREDIENTS_URL)
@@ -22,115 +22,103 @@ class PublicIngredientsApiTests(TestCase):
 
 
 class PrivateIngredientsApiTests(TestCase):
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('example@example.com')
+
     def setUp(self):
-        self.user = get_user_model().objects.create_user(
-            'example@example.com',
-            'password'
-        )
-        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
-    def test_retrieve_ingredients_list(self):
-        Ingredient.objects.create(
-            user=self.user,
-            name='Kale'
-        )
-        Ingredient.objects.create(
-            user=self.user,
-            name='Carrot'
-        )
+    def test_create_ingredient_cases(self):
+        cases = [
+            ({'name': 'Cabbage'}, status.HTTP_201_CREATED, True),
+            ({'name': ''}, status.HTTP_400_BAD_REQUEST, False),
+        ]
 
-        response = self.client.get(INGREDIENTS_URL)
+        for payload, expected_status, expected_exists in cases:
+            with self.subTest(payload=payload):
+                response = self.client.post(INGREDIENTS_URL, payload)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+                ingredient_exists = Ingredient.objects\
+                    .filter(user=self.user, name=payload['name']).exists()
 
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+                self.assertEqual(response.status_code, expected_status)
+                self.assertEqual(ingredient_exists, expected_exists)
 
-        self.assertEqual(response.data, serializer.data)
 
-    def test_retrieve_ingredients_list_for_user(self):
-        Ingredient.objects.create(
-            user=self.user,
+class ReadOnlyIngredientsApiTests(TestCase):
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('example@example.com')
+        cls.ingredient_a = Ingredient.objects.create(
+            user=cls.user,
             name='Kale'
         )
-
-        other_user = get_user_model().objects.create_user(
-            'other@example.com',
-            'password'
+        cls.ingredient_b = Ingredient.objects.create(
+            user=cls.user,
+            name='Carrot'
         )
+
+        other_user = User.objects.create_user('other@example.com')
         Ingredient.objects.create(
             user=other_user,
-            name='Carrot'
+            name='Pepper'
         )
 
-        response = self.client.get(INGREDIENTS_URL)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], 'Kale')
-
-    def test_create_ingredient(self):
-        payload = {'name': 'Cabbage'}
-
-        self.client.post(INGREDIENTS_URL, payload)
-
-        ingredient_exists = Ingredient.objects\
-            .filter(user=self.user, name=payload['name']).exists()
+        recipe_1 = Recipe.objects.create(
+            title='Pancakes',
+            time=4,
+            price=30.0,
+            user=cls.user
+        )
+        recipe_1.ingredients.add(cls.ingredient_a)
+        recipe_2 = Recipe.objects.create(
+            title='Kale chips',
+            time=4,
+            price=20.0,
+            user=cls.user
+        )
+        recipe_2.ingredients.add(cls.ingredient_a)
 
-        self.assertTrue(ingredient_exists)
+    def setUp(self):
+        self.client.force_authenticate(self.user)
 
-    def test_create_ingredient_invalid(self):
-        payload = {'name': ''}
+    def test_retrieve_ingredients_list(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(INGREDIENTS_URL)
 
-        response = self.client.post(INGREDIENTS_URL, payload)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        ingredient_exists = Ingredient.objects\
-            .filter(user=self.user, name=payload['name']).exists()
+        self.assertEqual(
+            {(ingredient['id'], ingredient['name'])
+             for ingredient in response.data},
+            {(ingredient.id, ingredient.name)
+             for ingredient in [self.ingredient_a, self.ingredient_b]}
+        )
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    def test_retrieve_ingredients_list_for_user(self):
+        response = self.client.get(INGREDIENTS_URL)
 
-        self.assertFalse(ingredient_exists)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-    def test_retrieve_ingredients_assigned_to_recipes(self):
-        ingredient_1 = Ingredient.objects.create(user=self.user, name='Pasta')
-        ingredient_2 = Ingredient.objects\
-            .create(user=self.user, name='Tomatoes')
-        recipe = Recipe.objects.create(
-            title='Spaghetti',
-            time=20,
-            price=14.00,
-            user=self.user
+        self.assertEqual(len(response.data), 2)
+        self.assertNotIn(
+            'Pepper',
+            [ingredient['name'] for ingredient in response.data]
         )
 
-        recipe.ingredients.add(ingredient_1)
-
+    def test_retrieve_ingredients_assigned_to_recipes(self):
         response = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
-        serializer_1 = IngredientSerializer(ingredient_1)
-        serializer_2 = IngredientSerializer(ingredient_2)
+        ingredient_ids = [ingredient['id'] for ingredient in response.data]
 
-        self.assertIn(serializer_1.data, response.data)
-        self.assertNotIn(serializer_2.data, response.data)
+        self.assertIn(self.ingredient_a.id, ingredient_ids)
+        self.assertNotIn(self.ingredient_b.id, ingredient_ids)
 
     def test_retrieve_ingredients_assigned_unique(self):
-        ingredient = Ingredient.objects.create(user=self.user, name='Flour')
-        Ingredient.objects.create(user=self.user, name='Banana')
-        recipe_1 = Recipe.objects.create(
-            title='Pancakes',
-            time=4,
-            price=30.0,
-            user=self.user
-        )
-        recipe_1.ingredients.add(ingredient)
-        recipe_2 = Recipe.objects.create(
-            title='Eggs',
-            time=4,
-            price=20.0,
-            user=self.user
-        )
-        recipe_2.ingredients.add(ingredient)
-
         response = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
         self.assertEqual(len(response.data), 1)
@@ -1,37 +1,44 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
+import pytest
+import shutil
 import tempfile
-import os
-from PIL import Image
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import Recipe, Tag, Ingredient
-from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 
 RECIPES_URL = reverse('recipe:recipe-list')
+IMAGE_UPLOAD_URL_TEMPLATE = reverse(
+    'recipe:recipe-upload-image',
+    args=[0]
+).replace('/0/', '/{}/')
+
+User = get_user_model()
+
+SAMPLE_RECIPE_DEFAULTS = {
+    'title': 'Sample recipe',
+    'time': 10,
+    'price': 12.06
+}
 
 
 def image_upload_url(recipe_id):
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+    return IMAGE_UPLOAD_URL_TEMPLATE.format(recipe_id)
 
 
 def detail_url(recipe_id):
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+    return f'{RECIPES_URL}{recipe_id}/'
 
 
 def sample_recipe(user, **kwargs):
-    defaults = {
-        'title': 'Sample recipe',
-        'time': 10,
-        'price': 12.06
-    }
-
-    defaults.update(kwargs)
-
-    return Recipe.objects.create(user=user, **defaults)
+    return Recipe.objects.create(
+        user=user,
+        **{**SAMPLE_RECIPE_DEFAULTS, **kwargs}
+    )
 
 
 def sample_tag(user, name='Sample tag'):
@@ -43,8 +50,7 @@ def sample_ingredient(user, name='Sample ingredient'):
 
 
 class PublicRecipeApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_authentication_is_required(self):
         response = self.client.get(RECIPES_URL)
@@ -52,112 +58,66 @@ class PublicRecipeApiTests(TestCase):
 
 
 class PrivateRecipeApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            email='example@example.com',
-            password='password'
-        )
-        self.client.force_authenticate(self.user)
-
-    def test_retrieve_recipes(self):
-        sample_recipe(user=self.user)
-        sample_recipe(user=self.user)
-
-        response = self.client.get(RECIPES_URL)
-
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
-
-    def test_recipes_limited_to_user(self):
-        other_user = get_user_model().objects.create_user(
-            email='other_example@example.com',
-            password='password'
-        )
-
-        sample_recipe(user=self.user)
-        sample_recipe(user=other_user)
-
-        response = self.client.get(RECIPES_URL)
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
-
-    def test_view_recipe_detail(self):
-        recipe = sample_recipe(user=self.user)
-        recipe.tags.add(sample_tag(user=self.user))
-        recipe.ingredients.add(sample_ingredient(user=self.user))
-
-        url = detail_url(recipe.id)
-        response = self.client.get(url)
-
-        serializer = RecipeDetailSerializer(recipe)
-
-        self.assertEqual(response.data, serializer.data)
-
-    def test_create_basic_recipe(self):
-        payload = {
-            'title': 'spaghetti',
-            'time': 20,
-            'price': 15.54
-        }
-
-        response = self.client.post(RECIPES_URL, payload)
+    client_class = APIClient
 
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.get(id=response.data['id'])
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('example@example.com')
 
-        self.assertEqual(recipe.title, payload['title'])
-        self.assertEqual(recipe.time, payload['time'])
-        self.assertEqual(float(recipe.price), payload['price'])
+    def setUp(self):
+        self.client.force_authenticate(self.user)
 
-    def test_create_recipe_with_tags(self):
+    def test_create_recipe_cases(self):
         tag_1 = sample_tag(user=self.user, name='Tag 1')
         tag_2 = sample_tag(user=self.user, name='Tag 2')
-
-        payload = {
-            'title': 'Tasty food',
-            'tags': [tag_2.id, tag_1.id],
-            'time': 30,
-            'price': 7.00
-        }
-
-        response = self.client.post(RECIPES_URL, payload)
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-
-        recipe = Recipe.objects.get(id=response.data['id'])
-        tags = recipe.tags.all()
-
-        self.assertEqual(tags.count(), 2)
-        self.assertIn(tag_1, tags)
-        self.assertIn(tag_2, tags)
-
-    def test_create_recipe_with_ingredients(self):
         ingredient_1 = sample_ingredient(user=self.user, name='Ginger')
         ingredient_2 = sample_ingredient(user=self.user, name='Prawns')
-        payload = {
-            'title': 'Chicken breasts with potatoes in tomato sauce',
-            'ingredients': [ingredient_2.id, ingredient_1.id],
-            'time': 48,
-            'price': 21.99
-        }
-
-        response = self.client.post(RECIPES_URL, payload)
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-
-        recipe = Recipe.objects.get(id=response.data['id'])
-        ingredients = recipe.ingredients.all()
-
-        self.assertEqual(ingredients.count(), 2)
-        self.assertIn(ingredient_1, ingredients)
-        self.assertIn(ingredient_2, ingredients)
+        cases = [
+            (
+                {'title': 'spaghetti', 'time': 20, 'price': 15.54},
+                [],
+                []
+            ),
+            (
+                {
+                    'title': 'Tasty food',
+                    'tags': [tag_2.id, tag_1.id],
+                    'time': 30,
+                    'price': 7.00
+                },
+                [tag_1, tag_2],
+                []
+            ),
+            (
+                {
+                    'title': 'Chicken breasts with potatoes in tomato sauce',
+                    'ingredients': [ingredient_2.id, ingredient_1.id],
+                    'time': 48,
+                    'price': 21.99
+                },
+                [],
+                [ingredient_1, ingredient_2]
+            ),
+        ]
+
+        for payload, expected_tags, expected_ingredients in cases:
+            with self.subTest(title=payload['title']):
+                response = self.client.post(RECIPES_URL, payload)
+
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_201_CREATED
+                )
+                recipe = Recipe.objects.get(id=response.data['id'])
+
+                self.assertEqual(recipe.title, payload['title'])
+                self.assertEqual(recipe.time, payload['time'])
+                self.assertEqual(float(recipe.price), payload['price'])
+                self.assertCountEqual(recipe.tags.all(), expected_tags)
+                self.assertCountEqual(
+                    recipe.ingredients.all(),
+                    expected_ingredients
+                )
 
     def test_partial_update_recipe(self):
         recipe = sample_recipe(user=self.user)
@@ -203,13 +163,117 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(len(tags), 0)
 
 
-class RecipeImageUploadTest(TestCase):
+class ReadOnlyRecipeApiTests(TestCase):
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('example@example.com')
+        other_user = User.objects.create_user('other_example@example.com')
+
+        cls.tag_1 = sample_tag(user=cls.user, name='Beef')
+        cls.tag_2 = sample_tag(user=cls.user, name='Pesto')
+        cls.ingredient_1 = sample_ingredient(user=cls.user, name='Pasta')
+        cls.ingredient_2 = sample_ingredient(user=cls.user, name='Yogurt')
+
+        cls.recipe_1 = sample_recipe(user=cls.user, title='Spaghetti')
+        cls.recipe_1.tags.add(cls.tag_1)
+        cls.recipe_1.ingredients.add(cls.ingredient_1)
+        cls.recipe_2 = sample_recipe(user=cls.user, title='Pesto pasta')
+        cls.recipe_2.tags.add(cls.tag_2)
+        cls.recipe_2.ingredients.add(cls.ingredient_2)
+        cls.recipe_3 = sample_recipe(user=cls.user, title='Fish and chips')
+
+        cls.other_recipe = sample_recipe(user=other_user)
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            email='test@examole.com',
-            password='pass'
+        self.client.force_authenticate(self.user)
+
+    def test_retrieve_recipes(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPES_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {recipe['id'] for recipe in response.data},
+            {self.recipe_1.id, self.recipe_2.id, self.recipe_3.id}
+        )
+
+    def test_recipes_limited_to_user(self):
+        response = self.client.get(RECIPES_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+        self.assertNotIn(
+            self.other_recipe.id,
+            [recipe['id'] for recipe in response.data]
+        )
+
+    def test_view_recipe_detail(self):
+        url = detail_url(self.recipe_1.id)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data, {
+            'id': self.recipe_1.id,
+            'title': 'Spaghetti',
+            'ingredients': [{'id': self.ingredient_1.id, 'name': 'Pasta'}],
+            'tags': [{'id': self.tag_1.id, 'name': 'Beef'}],
+            'time': 10,
+            'price': '12.06',
+            'link': '',
+        })
+
+    def test_filter_recipes_by_tags(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                RECIPES_URL,
+                {'tags': f'{self.tag_1.id},{self.tag_2.id}'}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {recipe['id'] for recipe in response.data},
+            {self.recipe_1.id, self.recipe_2.id}
+        )
+
+    def test_filter_recipes_by_ingredients(self):
+        ingredient_ids = f'{self.ingredient_1.id},{self.ingredient_2.id}'
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                RECIPES_URL,
+                {'ingredients': ingredient_ids}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {recipe['id'] for recipe in response.data},
+            {self.recipe_1.id, self.recipe_2.id}
         )
+
+
+@pytest.mark.slow
+class RecipeImageUploadTest(TestCase):
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        cls.media_root = tempfile.mkdtemp(prefix='recipe-test-media-')
+        cls.media_root_override = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_root_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.media_root_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('test@examole.com')
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
         self.recipe = sample_recipe(user=self.user)
 
@@ -217,16 +281,24 @@ class RecipeImageUploadTest(TestCase):
         self.recipe.image.delete()
 
     def test_upload_image_to_recipe(self):
+        # Imported here so collecting this module doesn't pay for PIL.
+        from io import BytesIO
+        import os
+        from PIL import Image
+
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as ntf:
-            img = Image.new('RGB', (10, 10))
-            img.save(ntf, format='JPEG')
-            ntf.seek(0)
-            response = self.client.post(
-                url,
-                {'image': ntf},
-                format='multipart'
-            )
+        buffer = BytesIO()
+        Image.new('RGB', (10, 10)).save(buffer, format='JPEG')
+        image = SimpleUploadedFile(
+            'test.jpg',
+            buffer.getvalue(),
+            content_type='image/jpeg'
+        )
+        response = self.client.post(
+            url,
+            {'image': image},
+            format='multipart'
+        )
 
         self.recipe.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -242,46 +314,3 @@ class RecipeImageUploadTest(TestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_filter_recipes_by_tags(self):
-        recipe_1 = sample_recipe(user=self.user, title='Spaghetti')
-        recipe_2 = sample_recipe(user=self.user, title='Pesto pasta')
-        tag_1 = sample_tag(user=self.user, name='Beef')
-        tag_2 = sample_tag(user=self.user, name='Pesto')
-        recipe_1.tags.add(tag_1)
-        recipe_2.tags.add(tag_2)
-        sample_recipe(user=self.user, title='Fish and chips')
-
-        response = self.client.get(
-            RECIPES_URL,
-            {'tags': f'{tag_1.id},{tag_2.id}'}
-        )
-
-        recipes = Recipe.objects.filter(tags__in=[tag_1, tag_2])\
-            .order_by('title')
-        serializer = RecipeSerializer(recipes, many=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(serializer.data, response.data)
-
-    def test_filter_recipes_by_ingredients(self):
-        recipe_1 = sample_recipe(user=self.user, title='Spaghetti')
-        recipe_2 = sample_recipe(user=self.user, title='Pesto pasta')
-        ingredient_1 = sample_ingredient(user=self.user, name='Pasta')
-        ingredient_2 = sample_ingredient(user=self.user, name='Yogurt')
-        recipe_1.ingredients.add(ingredient_1)
-        recipe_2.ingredients.add(ingredient_2)
-        sample_recipe(user=self.user, title='Fish and chips')
-
-        response = self.client.get(
-            RECIPES_URL,
-            {'ingredients': f'{ingredient_1.id},{ingredient_2.id}'}
-        )
-
-        recipes = Recipe.objects\
-            .filter(ingredients__in=[ingredient_2, ingredient_1])\
-            .order_by('title')
-        serializer = RecipeSerializer(recipes, many=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(serializer.data, response.data)
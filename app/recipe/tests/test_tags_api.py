@@ -4,16 +4,18 @@ from django.test import TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
+import django_perf_rec
 
 from core.models import Tag, Recipe
 from recipe.serializers import TagSerializer
 
 TAGS_URL = reverse('recipe:tag-list')
 
+User = get_user_model()
+
 
 class PublicTagsApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         response = self.client.get(TAGS_URL)
@@ -22,38 +24,41 @@ class PublicTagsApiTests(TestCase):
 
 
 class PrivateTagsApiTests(TestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
-            'example@example.com',
-            'password'
-        )
+    client_class = APIClient
 
-        self.client = APIClient()
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('example@example.com')
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tag_list(self):
-        Tag.objects.create(user=self.user, name='Ketogenic')
-        Tag.objects.create(user=self.user, name='Vegan')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Ketogenic'),
+            Tag(user=self.user, name='Vegan')
+        ])
 
-        response = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1), django_perf_rec.record():
+            response = self.client.get(TAGS_URL)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
-
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(
+            [tag['name'] for tag in response.data],
+            ['Vegan', 'Ketogenic']
+        )
 
     def test_retrieve_tag_list_limited_to_user(self):
-        Tag.objects.create(user=self.user, name='Ketogenic')
-        Tag.objects.create(user=self.user, name='Vegan')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Ketogenic'),
+            Tag(user=self.user, name='Vegan')
+        ])
 
-        other_user = get_user_model().objects.create_user(
-            'other@example.com'
-            'password'
-        )
+        other_user = User.objects.create_user('other@example.com')
         Tag.objects.create(user=other_user, name='ShouldNotSeeTag')
 
-        response = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            response = self.client.get(TAGS_URL)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)
@@ -94,7 +99,8 @@ class PrivateTagsApiTests(TestCase):
 
         recipe.tags.add(tag_1)
 
-        response = self.client.get(TAGS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            response = self.client.get(TAGS_URL, {'assigned_only': 1})
         serializer_1 = TagSerializer(tag_1)
         serializer_2 = TagSerializer(tag_2)
 
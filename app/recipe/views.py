@@ -51,7 +51,8 @@ class RecipeViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         tags = self.request.query_params.get('tags')
         ingredients = self.request.query_params.get('ingredients')
-        queryset = self.queryset.filter(user=self.request.user)
+        queryset = self.queryset.filter(user=self.request.user)\
+            .prefetch_related('tags', 'ingredients')
         if tags:
             tag_ids = self._params_to_list(tags)
             queryset = queryset.filter(tags__id__in=tag_ids)
@@ -3,19 +3,21 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
+import django_perf_rec
 
 CREATE_USER_URL = reverse('user:create')
 TOKEN_URL = reverse('user:token')
 ME_URL = reverse('user:me')
 
+User = get_user_model()
+
 
 def create_user(**params):
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
 class PublicUserApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_create_valid_user_success(self):
         payload = {
@@ -28,7 +30,7 @@ class PublicUserApiTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        user = get_user_model().objects.get(**response.data)
+        user = User.objects.get(**response.data)
         self.assertTrue(user.check_password(payload['password']))
         self.assertNotIn('password', response.data)
 
@@ -52,7 +54,7 @@ class PublicUserApiTests(TestCase):
         response = self.client.post(CREATE_USER_URL, payload)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exists = get_user_model().objects.\
+        user_exists = User.objects.\
             filter(email=payload['email']).exists()
 
         self.assertFalse(user_exists)
@@ -63,7 +65,7 @@ class PublicUserApiTests(TestCase):
             'password': 'password',
             'name': 'tokenizer'
         }
-        get_user_model().objects.create_user(**payload)
+        User.objects.create_user(**payload)
 
         response = self.client.post(TOKEN_URL, payload)
         self.assertIn('token', response.data)
@@ -75,7 +77,7 @@ class PublicUserApiTests(TestCase):
             'password': 'otherpassword',
             'name': 'tokenizer'
         }
-        get_user_model().objects.create_user(
+        User.objects.create_user(
             email=payload['email'],
             password='password',
             name='tokenizer'
@@ -114,17 +116,22 @@ class PublicUserApiTests(TestCase):
 
 
 class PrivateUserApiTests(TestCase):
-    def setUp(self):
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='example@example.com',
             password='authpass',
             name='authenticateduser'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):
-        response = self.client.get(ME_URL)
+        with django_perf_rec.record():
+            response = self.client.get(ME_URL)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, {
@@ -141,13 +148,21 @@ class PrivateUserApiTests(TestCase):
         )
 
     def test_update_user_profile(self):
+        # The PATCH modifies the authenticated user object in memory, so use
+        # a user of this test's own rather than the class-level one.
+        user = create_user(
+            email='updated@example.com',
+            password='authpass',
+            name='authenticateduser'
+        )
+        self.client.force_authenticate(user=user)
         payload = {
             'name': 'updatedname',
             'password': 'newpassword'
         }
         response = self.client.patch(ME_URL, payload)
-        self.user.refresh_from_db()
+        user.refresh_from_db()
 
-        self.assertEqual(self.user.name, payload['name'])
-        self.assertTrue(self.user.check_password(payload['password']))
+        self.assertEqual(user.name, payload['name'])
+        self.assertTrue(user.check_password(payload['password']))
         self.assertEqual(response.status_code, status.HTTP_200_OK)